@@ -4,7 +4,7 @@ import datetime
 import enum
 import json
 from typing import Annotated, Literal, Optional, TypedDict, Union
-from typing_schema import typing_to_schema, function_to_schema
+from typing_schema import typing_to_schema, function_to_schema, precompile
 from typing_schema.model import ArraySchema, BaseSchema, ObjectSchema, ValueSchema
 
 
@@ -257,6 +257,42 @@ def test_handle_typed():
     check("2024-01-01", schema)
 
 
+def test_returned_schema_is_caller_owned():
+    # Returned schemas must be safe to mutate at any depth without
+    # polluting later conversions of the same type (regression: cache hits
+    # shared nested dicts and type lists with the caller).
+    schema = typing_to_schema(Record)
+    schema["properties"]["id"]["description"] = "mutated"
+    schema["properties"]["content"]["type"].append("boolean")
+
+    fresh = typing_to_schema(Record)
+    assert "description" not in fresh["properties"]["id"]
+    assert fresh["properties"]["content"]["type"] == ["string", "null"]
+
+    def handler(a: int, b: str = "x") -> None:
+        pass
+
+    schema = function_to_schema(handler)
+    schema["properties"]["a"]["description"] = "mutated"
+
+    fresh = function_to_schema(handler)
+    assert "description" not in fresh["properties"]["a"]
+
+
+def test_annotated_without_doc():
+    # Annotated metadata that is not a string yields no description and
+    # must still convert cleanly (regression: the frozen primitive
+    # template leaked out of the Annotated branch and broke copying).
+    schema = typing_to_schema(Annotated[int, 1])
+    print(json.dumps(schema, indent=2))
+
+    assert schema == {"type": "integer"}
+    check(42, schema)
+
+    schema = typing_to_schema(Annotated[int, 1])
+    assert schema == {"type": "integer"}
+
+
 def test_handle_annotated_doc():
     doc = "Custom description for Annotated type"
 
@@ -294,6 +330,26 @@ def test_handle_annotated_doc():
     assert schema_props.get("name", {}).get("description") == "The name of the person"
 
 
+def test_precompile():
+    @precompile
+    def tool(a: int, b: str = "x") -> None:
+        """A precompiled tool"""
+        pass
+
+    assert tool.__typing_schema__ is not None
+
+    schema = function_to_schema(tool)
+    print(json.dumps(schema, indent=2))
+
+    check({"a": 1, "b": "y"}, schema)
+    assert schema == tool.__typing_schema__
+
+    # The returned schema is a copy; mutating it must not corrupt the
+    # precompiled one attached to the function.
+    schema["properties"]["a"]["description"] = "mutated"
+    assert "description" not in function_to_schema(tool)["properties"]["a"]
+
+
 def test_pydantic_model():
     try:
         from pydantic import BaseModel  # type: ignore
@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from typing_schema.converter import _Converter
+from typing_schema.converter import _as_mutable, _copy_schema, _Converter
 from typing_schema.model import BaseSchema
 
 
@@ -38,7 +38,7 @@ def typing_to_schema(
 
     converter = _Converter(raise_when_unsupported, type_handler, annotated_doc_handler)
     schema, _ = converter._convert_core(object)
-    return schema
+    return _as_mutable(schema)
 
 
 def function_to_schema(
@@ -68,6 +68,28 @@ def function_to_schema(
         `raise_when_unsupported` is True.
     """
 
+    cached = getattr(func, "__typing_schema__", None)
+    if cached is not None and type_handler is None and annotated_doc_handler is None:
+        return _copy_schema(cached)
+
     converter = _Converter(raise_when_unsupported, type_handler, annotated_doc_handler)
     schema, _ = converter._convert_function(func)
     return schema
+
+
+def precompile(func: Callable) -> Callable:
+    """Decorator that generates a function's schema at decoration time.
+
+    Parameters:
+    - func (Callable): The function to precompile. Its schema is generated
+        once with the default converter settings and attached to the
+        function as `__typing_schema__`.
+
+    Returns:
+    - Callable: The same function. Later `function_to_schema` calls with
+        default handlers return a copy of the attached schema instead of
+        re-walking the signature.
+    """
+
+    func.__typing_schema__ = function_to_schema(func)
+    return func
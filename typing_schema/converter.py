@@ -1,5 +1,5 @@
 import enum
-from types import UnionType
+from types import MappingProxyType, UnionType
 from typing import (
     Annotated,
     Callable,
@@ -19,44 +19,106 @@ from typing_schema.model import (
     ValueSchema,
 )
 from dataclasses import is_dataclass
+import functools
 import inspect
+import sys
 
 from importlib.util import find_spec
+from weakref import WeakKeyDictionary
+
+# Probe the import system once at module load instead of on every
+# _Converter construction.
+_PYDANTIC_AVAILABLE = find_spec("pydantic") is not None
+
+# model_json_schema() output per pydantic model class; generation is
+# non-trivial and the result is stable for a given class.
+_PYDANTIC_SCHEMA_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+# Origins converted to an array schema.
+_ARRAY_ORIGINS = frozenset({list, tuple, set})
+
+# The schema type strings are interned so membership tests and comparisons
+# against them hit CPython's pointer-equality fast path even when a type
+# string was built dynamically rather than taken from a compiled literal.
+# Schema types that cannot be folded into a flat `type` list inside a Union.
+_COMPLEX_TYPES = frozenset(map(sys.intern, ("array", "object")))
+
+_PRIMITIVE_TYPE_MAP = {
+    str: sys.intern("string"),
+    int: sys.intern("integer"),
+    float: sys.intern("number"),
+    bool: sys.intern("boolean"),
+    dict: sys.intern("object"),
+    list: sys.intern("array"),
+}
+
+# Pre-built frozen leaf schemas so primitive types can exit conversion with
+# a single dict lookup, before any get_origin call. The shared templates are
+# read-only; _as_mutable materializes a private copy wherever a schema is
+# mutated or embedded in a result handed back to the caller.
+_FROZEN_PRIMITIVES = {
+    t: MappingProxyType(ValueSchema(type=s)) for t, s in _PRIMITIVE_TYPE_MAP.items()
+}
+
+
+def _as_mutable(schema: BaseSchema) -> BaseSchema:
+    """Turn a shared frozen schema template into a private mutable dict."""
+    if type(schema) is MappingProxyType:
+        return dict(schema)  # type: ignore
+    return schema
+
+
+def _copy_schema(schema: BaseSchema) -> BaseSchema:
+    """Copy a cached schema so the caller may mutate it at any depth.
+
+    Nested dicts and lists (properties, items, oneOf, type lists, ...) are
+    duplicated structurally; leaf values are shared, which is safe because
+    they are immutable.
+    """
+    out = {}
+    for key, value in schema.items():
+        value_type = type(value)
+        if value_type is dict or value_type is MappingProxyType:
+            out[key] = _copy_schema(value)
+        elif value_type is list:
+            out[key] = [
+                _copy_schema(item)
+                if type(item) is dict or type(item) is MappingProxyType
+                else item
+                for item in value
+            ]
+        else:
+            out[key] = value
+    return out  # type: ignore
 
 
-def _is_union(annotation: type) -> bool:
-    """Check if a type annotation is Union."""
-    origin = get_origin(annotation)
-    return origin is Union or origin is UnionType
-
-
-def _is_literal(annotation: type) -> bool:
-    """Check if a type annotation is Literal."""
-    origin = get_origin(annotation)
-    return origin is Literal
+# Member values per enum class; enums are immutable once defined.
+_ENUM_VALUES_CACHE: WeakKeyDictionary = WeakKeyDictionary()
 
+# ObjectSchema templates per TypedDict/dataclass; the annotation set of a
+# class never changes at runtime, so its schema only has to be built once.
+_CLASS_SCHEMA_CACHE: WeakKeyDictionary = WeakKeyDictionary()
 
-def _is_array(annotation: type) -> bool:
-    """Check if a type annotation is a sequence (like list or tuple)."""
-    origin = get_origin(annotation)
-    return origin in [list, tuple, set]
+# Schemas keyed by the converted type, shared by every converter that uses
+# the default handlers. Conversion is pure for hashable inputs, so the cached
+# template can be reused; callers receive a _copy_schema copy they may mutate.
+# Weak keys keep ad-hoc classes and closures collectable; keys that do not
+# support weak references (e.g. `X | Y` unions) raise TypeError on lookup and
+# simply stay uncached, like unhashable inputs.
+_GLOBAL_SCHEMA_CACHE: WeakKeyDictionary = WeakKeyDictionary()
 
 
-def _is_dict(annotation: type) -> bool:
-    """Check if a type annotation is a dictionary."""
-    origin = get_origin(annotation)
-    return origin is dict
+@functools.lru_cache(maxsize=1024)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Resolve a callable's signature once; Signature objects are immutable."""
+    return inspect.signature(func)
 
 
 def _is_enum(annotation: type) -> bool:
     """Check if a type annotation is an Enum."""
-    return isinstance(annotation, type) and issubclass(annotation, enum.Enum)
-
-
-def _is_annotated(annotation: type) -> bool:
-    """Check if a type annotation is a typing annotation."""
-    origin = get_origin(annotation)
-    return origin is Annotated
+    # Every enum class is an instance of EnumMeta, so a single metaclass
+    # check replaces the isinstance(annotation, type) + issubclass pair.
+    return isinstance(annotation, enum.EnumMeta)
 
 
 class _Converter:
@@ -67,96 +129,255 @@ class _Converter:
         annotated_doc_handler: Callable[[tuple[type]], str] | None = None,
     ) -> None:
         self.to_doc = annotated_doc_handler or self._hande_annotated_doc
+        self._doc_is_default = annotated_doc_handler is None
         self._raise_when_unsupported = raise_when_unsupported
         self._type_handler = type_handler
 
-        self._enable_pydantic = find_spec("pydantic") is not None
-
-    def _convert_pydantic_model(self, model: type) -> BaseSchema | None:
-        """Convert a Pydantic model to a schema using Pydantic's built-in schema generation."""
-        if self._enable_pydantic and hasattr(model, "model_json_schema"):
-            return model.model_json_schema()
+        self._enable_pydantic = _PYDANTIC_AVAILABLE
 
-        return None
+        if (
+            raise_when_unsupported
+            and type_handler is None
+            and annotated_doc_handler is None
+        ):
+            self._cache = _GLOBAL_SCHEMA_CACHE
+        else:
+            self._cache: dict = {}
+
+        # Subscripted annotations are dispatched on their origin in a single
+        # dict lookup instead of re-deriving the origin per predicate.
+        self._origin_dispatch: dict[object, Callable] = {
+            Union: self._handle_union_origin,
+            UnionType: self._handle_union_origin,
+            Literal: self._handle_literal_origin,
+            dict: self._handle_dict_origin,
+            Annotated: self._handle_annotated_origin,
+        }
+        for origin in _ARRAY_ORIGINS:
+            self._origin_dispatch[origin] = self._handle_array_origin
 
     def _hande_annotated_doc(self, args: tuple[type, ...]) -> str | None:
         """Extract documentation from an Annotated type."""
-        for arg in args[1:]:
+        # Index directly instead of slicing off a new tuple per call.
+        for i in range(1, len(args)):
+            arg = args[i]
             if isinstance(arg, str):
                 return arg
         return None
 
     def _convert_union(self, annotations: tuple[type, ...]) -> tuple[BaseSchema, bool]:
         """Convert a Union type annotation to a BaseSchema."""
-        require = not (type(None) in annotations)
+        # Optional[T] / T | None is by far the most common union shape;
+        # convert the single member directly instead of running the
+        # general multi-member loop.
+        if len(annotations) == 2:
+            if annotations[0] is type(None):
+                other = annotations[1]
+            elif annotations[1] is type(None):
+                other = annotations[0]
+            else:
+                other = None
+
+            if other is not None:
+                schema, _ = self._convert_core(other)
+                schema_type = schema.get("type")
+                if isinstance(schema_type, str) and schema_type not in _COMPLEX_TYPES:
+                    schema = _as_mutable(schema)
+                    schema["type"] = [schema_type, "null"]
+                    return schema, False
+                return (
+                    OneOfSchema(oneOf=[_as_mutable(schema), ValueSchema(type="null")]),
+                    False,
+                )
 
-        if len(annotations) == 0:
-            return ValueSchema(type="null"), False
+        has_none = False
+        schemas: list[BaseSchema] = []
+        simple_types: list | None = []
 
-        if len(annotations) == 1:
-            return self._convert_core(annotations[0])[0], require
+        _convert = self._convert_core
+        for annotation in annotations:
+            if annotation is type(None):
+                has_none = True
+                continue
 
-        schemas = [self._convert_core(ann)[0] for ann in annotations]
+            schema = _convert(annotation)[0]
+            schemas.append(schema)
 
-        if all(
-            "type" in s.keys() and s["type"] not in ["array", "object"] for s in schemas  # type: ignore
-        ):
-            return (
-                ValueSchema(type=[s["type"] for s in schemas]),  # type: ignore
-                require,
-            )
+            if simple_types is not None:
+                schema_type = schema.get("type")
+                if isinstance(schema_type, str) and schema_type not in _COMPLEX_TYPES:
+                    simple_types.append(schema_type)
+                else:
+                    simple_types = None
 
-        return OneOfSchema(oneOf=schemas), require
+        require = not has_none
 
-    def _convert_function(self, func: Callable) -> tuple[BaseSchema, bool]:
-        sig = inspect.signature(func)
-        properties = {}
-        required = []
+        if len(schemas) == 0:
+            return ValueSchema(type="null"), False
 
-        for name, param in sig.parameters.items():
-            if (
-                param.kind
-                in (
-                    inspect.Parameter.VAR_POSITIONAL,
-                    inspect.Parameter.VAR_KEYWORD,
-                )
-                or param.name == "self"
-            ):
-                continue  # Skip *args and **kwargs
+        if len(schemas) == 1 and not has_none:
+            return schemas[0], require
+
+        if simple_types is not None:
+            if has_none:
+                simple_types.append("null")
+            return ValueSchema(type=simple_types), require
+
+        if has_none:
+            schemas.append(ValueSchema(type="null"))
+        return OneOfSchema(oneOf=[_as_mutable(s) for s in schemas]), require
+
+    def _handle_union_origin(self, args: tuple[type, ...]) -> tuple[BaseSchema, bool]:
+        """Convert a `Union[...]` / `X | Y` annotation."""
+        return self._convert_union(args)
+
+    def _handle_array_origin(self, args: tuple[type, ...]) -> tuple[BaseSchema, bool]:
+        """Convert a `list`/`tuple`/`set` annotation."""
+        item_schema, _ = self._convert_union(args)
+        return ArraySchema(type="array", items=_as_mutable(item_schema)), True
+
+    def _handle_dict_origin(self, args: tuple[type, ...]) -> tuple[BaseSchema, bool]:
+        """Convert a subscripted `dict` annotation."""
+        schema: ObjectSchema = {"type": "object"}
+        return schema, True
+
+    def _handle_annotated_origin(
+        self, args: tuple[type, ...]
+    ) -> tuple[BaseSchema, bool]:
+        """Convert an `Annotated[...]` annotation."""
+        item_schema, required = self._convert_core(args[0])
+
+        if "description" not in item_schema:
+            if self._doc_is_default and len(args) == 2:
+                # The common `Annotated[T, "doc"]` shape needs no dispatch.
+                doc = args[1] if isinstance(args[1], str) else None
+            else:
+                doc = self.to_doc(args)
 
-            test_annotation = param.annotation
+            if doc:
+                item_schema = _as_mutable(item_schema)
+                item_schema["description"] = doc
 
-            if param.annotation is inspect.Parameter.empty:
-                if param.default is not inspect.Parameter.empty:
-                    test_annotation = type(param.default)
-                elif not self._raise_when_unsupported:
-                    test_annotation = dict
-                else:
-                    raise ValueError(
-                        f"Parameter '{name}' is missing a type annotation."
-                    )
+        # Never let a frozen template escape: the caller may cache and
+        # copy this schema, which a mappingproxy does not support.
+        return _as_mutable(item_schema), required
+
+    def _handle_literal_origin(
+        self, args: tuple[type, ...]
+    ) -> tuple[BaseSchema, bool]:
+        """Convert a `Literal[...]` annotation."""
+        if len(args) == 0:
+            return ValueSchema(type="null"), False
+
+        if len(args) == 1:
+            return ConstraintSchema(const=args[0]), True
+        return EnumSchema(enum=list(args)), True
 
-            schema, is_required = self._convert_core(test_annotation)
-            if param.default is not inspect.Parameter.empty:
-                schema["default"] = param.default  # type: ignore
+    def _convert_function(self, func: Callable) -> tuple[BaseSchema, bool]:
+        try:
+            cached_schema, cached_required = self._cache[func]
+            return _copy_schema(cached_schema), cached_required
+        except (KeyError, TypeError):
+            pass
 
-            properties[name] = schema
+        sig = _cached_signature(func)
+        properties = {}
+        required = []
 
-            if is_required and param.default is inspect.Parameter.empty:
-                required.append(name)
+        _empty = inspect.Parameter.empty
+        _skip_kinds = (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        )
+        _convert = self._convert_core
 
-        obj_schema = ObjectSchema(
-            type="object",
-            properties=properties,
-            required=required,
+        params = sig.parameters
+        needs_slow_path = any(
+            p.kind in _skip_kinds or p.name == "self" or p.annotation is _empty
+            for p in params.values()
         )
 
-        if hasattr(func, "__doc__") and func.__doc__:
-            obj_schema["description"] = func.__doc__
+        if not needs_slow_path:
+            # Fully annotated signature without *args/**kwargs/self — the
+            # common shape for tool functions — needs none of the per-
+            # parameter guards.
+            for name, param in params.items():
+                schema, is_required = _convert(param.annotation)
+                schema = _as_mutable(schema)
+
+                default = param.default
+                if default is not _empty:
+                    schema["default"] = default  # type: ignore
+                elif is_required:
+                    required.append(name)
+
+                properties[name] = schema
+        else:
+            for name, param in params.items():
+                if param.kind in _skip_kinds or name == "self":
+                    continue  # Skip *args and **kwargs
+
+                test_annotation = param.annotation
+                default = param.default
+
+                if test_annotation is _empty:
+                    if default is not _empty:
+                        test_annotation = type(default)
+                    elif not self._raise_when_unsupported:
+                        test_annotation = dict
+                    else:
+                        raise ValueError(
+                            f"Parameter '{name}' is missing a type annotation."
+                        )
+
+                schema, is_required = _convert(test_annotation)
+                schema = _as_mutable(schema)
+                if default is not _empty:
+                    schema["default"] = default  # type: ignore
+
+                properties[name] = schema
+
+                if is_required and default is _empty:
+                    required.append(name)
+
+        obj_schema: ObjectSchema = {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+        }
+
+        doc = getattr(func, "__doc__", None)
+        if doc:
+            obj_schema["description"] = doc
 
-        return obj_schema, True
+        try:
+            self._cache[func] = (obj_schema, True)
+        except TypeError:
+            return obj_schema, True
+        return _copy_schema(obj_schema), True
 
     def _convert_core(self, object: type) -> tuple[BaseSchema, bool]:
+        """Convert a Python type to a schema, memoized by the type itself."""
+
+        try:
+            if self._type_handler is None:
+                cached = _FROZEN_PRIMITIVES.get(object)
+                if cached is not None:
+                    return cached, True  # type: ignore
+
+            schema, required = self._cache[object]
+            return _copy_schema(schema), required
+        except TypeError:
+            # Unhashable or non-weak-referenceable inputs cannot be memoized.
+            return self._convert_core_uncached(object)
+        except KeyError:
+            pass
+
+        schema, required = self._convert_core_uncached(object)
+        self._cache[object] = (schema, required)
+        return _copy_schema(schema), required
+
+    def _convert_core_uncached(self, object: type) -> tuple[BaseSchema, bool]:
         """Convert a Python type to a ValueSchema."""
 
         if self._type_handler:
@@ -164,82 +385,74 @@ class _Converter:
             if custom_schema:
                 return custom_schema, True
 
-        if self._enable_pydantic:
-            pydantic_schema = self._convert_pydantic_model(object)
-            if pydantic_schema:
-                return pydantic_schema, True
-
-        if _is_union(object):
-            item_schema, required = self._convert_union(get_args(object))
-            return item_schema, required
-
-        if _is_array(object):
-            item_schema, _ = self._convert_union(get_args(object))
-            return (
-                ArraySchema(type="array", items=item_schema),
-                True,
-            )
-
-        if _is_annotated(object):
-            args = get_args(object)
-            item_schema, required = self._convert_core(args[0])
-
-            if "description" not in item_schema:
-                doc = self.to_doc(args)
-                if doc:
-                    item_schema["description"] = doc
-
-            return item_schema, required
-
-        if _is_literal(object):
-            args = get_args(object)
-            if len(args) == 0:
-                return ValueSchema(type="null"), False
+        if object is type(None):
+            null_schema: ValueSchema = {"type": "null"}
+            return null_schema, False
 
-            if len(args) == 1:
-                return ConstraintSchema(const=args[0]), True
-            return EnumSchema(enum=list(args)), True
+        if (
+            self._enable_pydantic
+            and isinstance(object, type)
+            and hasattr(object, "model_json_schema")
+        ):
+            pydantic_schema = _PYDANTIC_SCHEMA_CACHE.get(object)
+            if pydantic_schema is None:
+                pydantic_schema = object.model_json_schema()
+                _PYDANTIC_SCHEMA_CACHE[object] = pydantic_schema
+            return pydantic_schema, True
+
+        origin = get_origin(object)
+        if origin is not None:
+            handler = self._origin_dispatch.get(origin)
+            if handler is not None:
+                return handler(get_args(object))
 
         if _is_enum(object):
-            enum_values = [member.value for member in object]  # type: ignore
-            return EnumSchema(enum=enum_values), True
+            enum_values = _ENUM_VALUES_CACHE.get(object)
+            if enum_values is None:
+                enum_values = [member.value for member in object]  # type: ignore
+                _ENUM_VALUES_CACHE[object] = enum_values
+            # Copy so callers can mutate the returned schema freely.
+            return EnumSchema(enum=list(enum_values)), True
 
         if is_typeddict(object) or is_dataclass(object):
+            # The template is only reusable when no custom handler could
+            # have shaped the result.
+            can_share = self._type_handler is None and self._doc_is_default
+            if can_share:
+                cached = _CLASS_SCHEMA_CACHE.get(object)
+                if cached is not None:
+                    return _copy_schema(cached), True
+
             annotations = object.__annotations__
             required_items = []
             properties = {}
 
+            _convert = self._convert_core
             for key, value in annotations.items():
-                schema, is_required = self._convert_core(value)
-                properties[key] = schema
+                schema, is_required = _convert(value)
+                properties[key] = _as_mutable(schema)
                 if is_required:
                     required_items.append(key)
 
-            obj_schema = ObjectSchema(
-                type="object", properties=properties, required=required_items
-            )
+            obj_schema: ObjectSchema = {
+                "type": "object",
+                "properties": properties,
+                "required": required_items,
+            }
 
-            if hasattr(object, "__doc__") and object.__doc__:
-                obj_schema["description"] = object.__doc__
+            doc = getattr(object, "__doc__", None)
+            if doc:
+                obj_schema["description"] = doc
 
-            return obj_schema, True
-
-        if _is_dict(object):
-            return ObjectSchema(type="object"), True
+            if can_share and self._raise_when_unsupported:
+                # A schema built without raise_when_unsupported may contain
+                # fallback object schemas, so it must not be shared.
+                _CLASS_SCHEMA_CACHE[object] = obj_schema
 
-        if object is type(None):
-            return ValueSchema(type="null"), False
+            return obj_schema, True
 
-        mapping = {
-            str: "string",
-            int: "integer",
-            float: "number",
-            bool: "boolean",
-            dict: "object",
-            list: "array",
-        }
-        if object in mapping:
-            return ValueSchema(type=mapping[object]), True  # type: ignore
+        if object in _PRIMITIVE_TYPE_MAP:
+            return ValueSchema(type=_PRIMITIVE_TYPE_MAP[object]), True  # type: ignore
 
         if callable(object):
             return self._convert_function(object)
@@ -247,4 +460,5 @@ class _Converter:
         if self._raise_when_unsupported:
             raise ValueError(f"Unsupported type: {object}")
         else:
-            return ObjectSchema(type="object"), True
+            fallback: ObjectSchema = {"type": "object"}
+            return fallback, True